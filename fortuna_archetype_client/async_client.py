@@ -0,0 +1,227 @@
+"""
+Async Archetype API Client
+
+An asyncio-native variant of ArchetypeClient built on httpx. Requests are
+multiplexed over HTTP/2 when the server supports it, which suits fetching
+many archetypes at once.
+
+Requires the optional "async" extra:
+
+    pip install fortuna-archetype-client[async]
+"""
+
+import asyncio
+import json
+import threading
+from typing import Dict, List, Optional, Tuple
+from .client import ArchetypeClient, _hmac_sha256_pads
+from .exceptions import ArchetypeAPIError, AuthenticationError
+
+try:
+    import httpx
+except ImportError:  # optional dependency, see the "async" extra
+    httpx = None
+
+
+class AsyncArchetypeClient:
+    """
+    Async client for interacting with the Fortuna Archetype API.
+    
+    Mirrors the request API of ArchetypeClient and signs requests the same
+    way. Responses are not cached.
+    
+    Example:
+        >>> async with AsyncArchetypeClient(
+        ...     base_url="https://api.example.com",
+        ...     api_key="your-api-key",
+        ...     api_secret="your-api-secret"
+        ... ) as client:
+        ...     result = await client.get_strategy_archetypes("A052")
+        ...     archetypes = await client.get_archetypes(result["archepids"])
+    """
+    
+    __slots__ = (
+        "base_url",
+        "api_key",
+        "api_secret",
+        "timeout",
+        "_ipad_ctx",
+        "_opad_ctx",
+        "_sig_cache",
+        "_sig_cache_second",
+        "_sig_cache_lock",
+        "_client",
+    )
+    
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        api_secret: str,
+        timeout: int = 30,
+        max_connections: int = 50,
+    ):
+        """
+        Initialize the async Archetype API client.
+        
+        Args:
+            base_url: Base URL of the API (e.g., "https://api.example.com")
+            api_key: API key for authentication
+            api_secret: API secret for HMAC signature generation
+            timeout: Request timeout in seconds (default: 30)
+            max_connections: Maximum number of open connections (default: 50)
+        
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncArchetypeClient requires httpx: "
+                "pip install fortuna-archetype-client[async]"
+            )
+        
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.timeout = timeout
+        self._ipad_ctx, self._opad_ctx = _hmac_sha256_pads(api_secret)
+        self._sig_cache: Dict[Tuple[str, int], str] = {}
+        self._sig_cache_second = 0
+        self._sig_cache_lock = threading.Lock()
+        
+        self._client = httpx.AsyncClient(
+            http2=True,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_connections),
+            headers={
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+            },
+        )
+    
+    _STRATEGY_PREFIX = ArchetypeClient._STRATEGY_PREFIX
+    _ARCHETYPE_PREFIX = ArchetypeClient._ARCHETYPE_PREFIX
+    
+    # Signing and decoding do no I/O, so they are shared with the sync client
+    _generate_signature = ArchetypeClient._generate_signature
+    _get_headers = ArchetypeClient._get_headers
+    _parse_json = ArchetypeClient._parse_json
+    
+    async def close(self) -> None:
+        """Close the underlying HTTP client and its connections."""
+        await self._client.aclose()
+    
+    async def __aenter__(self) -> "AsyncArchetypeClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+    
+    async def _make_request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict] = None,
+        json_data: Optional[Dict] = None,
+    ) -> Dict:
+        """
+        Make an authenticated HTTP request to the API.
+        
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: API endpoint path (e.g., "/internal/archetype/strategy/A052")
+            params: URL query parameters (optional)
+            json_data: JSON body data (optional)
+        
+        Returns:
+            Response data as dictionary
+        
+        Raises:
+            ArchetypeAPIError: If the API returns an error
+            AuthenticationError: If authentication fails
+        """
+        url = self.base_url + path
+        
+        # Serialize the body once: the same bytes are signed and sent, in the
+        # compact sorted-key form documented in INTERNAL_API_SETUP.md
+        body_bytes = None
+        if json_data:
+            body_bytes = json.dumps(json_data, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        
+        headers = self._get_headers(method, path, body_bytes)
+        
+        try:
+            response = await self._client.request(
+                method,
+                url,
+                headers=headers,
+                params=params,
+                content=body_bytes,
+            )
+        except httpx.HTTPError as e:
+            raise ArchetypeAPIError(
+                message=f"Request failed: {str(e)}",
+                status_code=0,
+            )
+        
+        # Handle authentication errors
+        if response.status_code == 401:
+            raise AuthenticationError("Authentication failed: Invalid API key or signature")
+        
+        # Handle other errors
+        if response.status_code >= 400:
+            error_data = {}
+            if response.content:
+                try:
+                    error_data = self._parse_json(response)
+                except ArchetypeAPIError:
+                    pass
+            error_msg = error_data.get("errmsg", f"API error: {response.status_code}")
+            raise ArchetypeAPIError(
+                message=error_msg,
+                status_code=response.status_code,
+                error_code=error_data.get("errorcode"),
+            )
+        
+        return self._parse_json(response)
+    
+    async def get_strategy_archetypes(self, sid: str) -> Dict[str, List[str]]:
+        """
+        Get all archetype IDs for a strategy.
+        
+        Args:
+            sid: Strategy ID (4 characters, e.g., "A052")
+        
+        Returns:
+            Dictionary with "archepids" key containing list of archetype IDs
+        """
+        return await self._make_request("GET", self._STRATEGY_PREFIX + sid)
+    
+    async def get_archetype(self, archepid: str) -> Dict[str, Dict]:
+        """
+        Get archetype by ID.
+        
+        Args:
+            archepid: Archetype ID (e.g., "A052071812-7a9581c6-ad66-474b-a738-5d00ee9ec3c2")
+        
+        Returns:
+            Dictionary with "archetypeportfolio" key containing the portfolio allocation
+        """
+        return await self._make_request("GET", self._ARCHETYPE_PREFIX + archepid)
+    
+    async def get_archetypes(self, archepids: List[str]) -> Dict[str, Dict[str, Dict]]:
+        """
+        Get several archetypes concurrently.
+        
+        Args:
+            archepids: Archetype IDs to fetch (duplicates are fetched once)
+        
+        Returns:
+            Dictionary mapping each archetype ID to its get_archetype() result
+        
+        Raises:
+            ArchetypeAPIError: If any of the lookups fails
+        """
+        unique_ids = list(dict.fromkeys(archepids))
+        results = await asyncio.gather(*[self.get_archetype(a) for a in unique_ids])
+        return dict(zip(unique_ids, results))
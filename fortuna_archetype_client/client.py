@@ -5,13 +5,150 @@ This client provides methods to interact with the Fortuna Archetype API
 using HMAC SHA256 authentication.
 """
 
-import hmac
+import copy
 import hashlib
+import json
+import logging
+import threading
 import time
 import requests
-from typing import Dict, List, Optional
+from cachetools import LRUCache
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from urllib3.util.retry import Retry
 from .exceptions import ArchetypeAPIError, AuthenticationError
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# SHA-256 block size, the length HMAC pads the key to
+_SHA256_BLOCK_SIZE = 64
+
+# hashlib.sha256 dispatches to OpenSSL's EVP implementation, which uses the
+# CPU's SHA extensions (SHA-NI) where available. Python builds without
+# OpenSSL fall back to a much slower portable implementation.
+_SHA256_USES_OPENSSL = getattr(hashlib.sha256, "__name__", "") == "openssl_sha256"
+if _SHA256_USES_OPENSSL:
+    try:
+        import ssl
+        logger.debug("Request signing uses OpenSSL sha256 (%s)", ssl.OPENSSL_VERSION)
+    except ImportError:
+        logger.debug("Request signing uses OpenSSL sha256")
+else:
+    logger.debug("Request signing uses the builtin sha256; OpenSSL hashing is unavailable")
+
+
+def _hmac_sha256_pads(secret: str) -> Tuple["hashlib._Hash", "hashlib._Hash"]:
+    """
+    Precompute the HMAC-SHA256 inner and outer hash states for a secret.
+    
+    HMAC(key, msg) = H((key ^ opad) + H((key ^ ipad) + msg)); hashing the
+    padded key once lets each signature start from a copy of these states.
+    
+    Args:
+        secret: HMAC key
+    
+    Returns:
+        Tuple of (inner, outer) sha256 objects; copy them before updating
+    """
+    key = secret.encode("utf-8")
+    if len(key) > _SHA256_BLOCK_SIZE:
+        key = hashlib.sha256(key).digest()
+    key = key.ljust(_SHA256_BLOCK_SIZE, b"\x00")
+    
+    inner = hashlib.sha256(bytes(b ^ 0x36 for b in key))
+    outer = hashlib.sha256(bytes(b ^ 0x5C for b in key))
+    return inner, outer
+
+
+# Marks a response that _parse_response_hook could not decode
+_UNPARSED = object()
+
+
+def _loads(content: bytes) -> Dict:
+    """Decode JSON bytes with orjson when it is installed, else stdlib json."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _parse_response_hook(response: requests.Response, *args, **kwargs) -> requests.Response:
+    """
+    Session response hook that decodes the JSON body once, up front.
+    
+    The result is stored on ``response._parsed`` for _parse_json. Bodies
+    that are not valid JSON are left unparsed, so _parse_json can report
+    the error (or the error path can ignore it).
+    """
+    try:
+        response._parsed = _loads(response.content)
+    except ValueError:
+        pass
+    return response
+
+
+# Longest server-requested Retry-After wait honoured between retries, in
+# seconds. Retries resend the original signed headers, so long waits would
+# push X-Timestamp out of the server's 5-minute acceptance window.
+_MAX_RETRY_AFTER = 5.0
+
+
+class _CappedRetry(Retry):
+    """Retry policy that caps server-requested Retry-After waits."""
+    
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, _MAX_RETRY_AFTER)
+
+
+def _build_retry(max_retries: int) -> Retry:
+    """
+    Build the urllib3 retry policy mounted on the client session.
+    
+    Only GETs are retried on transient gateway errors, and retried requests
+    reuse their signed headers. A Retry-After header is honoured, but the
+    wait is capped at _MAX_RETRY_AFTER seconds so retries stay well inside
+    the signed timestamp's validity window. Other 4xx/5xx replies,
+    including 401, are returned to the caller straight away. Once retries
+    are exhausted the last response is returned so it surfaces as an
+    ArchetypeAPIError with its status code.
+    
+    Args:
+        max_retries: Maximum number of retries
+    
+    Returns:
+        Retry policy with exponential backoff
+    """
+    kwargs = dict(
+        total=max_retries,
+        backoff_factor=0.25,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=frozenset(["GET"]),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    try:
+        # Jitter spreads out retries from concurrent requests (urllib3 >= 2.0)
+        return _CappedRetry(backoff_jitter=0.25, **kwargs)
+    except TypeError:
+        return _CappedRetry(**kwargs)
+
+
+class _CacheEntry(NamedTuple):
+    """Cached GET response with its HTTP validators."""
+    
+    body: Dict
+    etag: Optional[str]
+    last_modified: Optional[str]
+    expires_at: float
+
 
 class ArchetypeClient:
     """
@@ -27,14 +164,47 @@ class ArchetypeClient:
         ... )
         >>> archetypes = client.get_strategy_archetypes("A052")
         >>> archetype = client.get_archetype("A052071812-7a9581c6-...")
+    
+    The client keeps a persistent HTTP session so connections are reused
+    across calls. Use it as a context manager (or call ``close()``) to
+    release the pooled connections when done:
+    
+        >>> with ArchetypeClient(...) as client:
+        ...     archetypes = client.get_strategy_archetypes("A052")
     """
     
+    __slots__ = (
+        "base_url",
+        "api_key",
+        "api_secret",
+        "timeout",
+        "max_workers",
+        "_ipad_ctx",
+        "_opad_ctx",
+        "_sig_cache",
+        "_sig_cache_second",
+        "_sig_cache_lock",
+        "_cache_ttl",
+        "_cache",
+        "_cache_lock",
+        "_session",
+        "_pool_maxsize",
+    )
+    
+    # Endpoint path prefixes
+    _STRATEGY_PREFIX = "/internal/archetype/strategy/"
+    _ARCHETYPE_PREFIX = "/internal/archetype/"
+    
     def __init__(
         self,
         base_url: str,
         api_key: str,
         api_secret: str,
         timeout: int = 30,
+        cache_ttl: int = 900,
+        cache_enabled: bool = True,
+        max_workers: int = 8,
+        max_retries: int = 3,
     ):
         """
         Initialize the Archetype API client.
@@ -44,71 +214,184 @@ class ArchetypeClient:
             api_key: API key for authentication
             api_secret: API secret for HMAC signature generation
             timeout: Request timeout in seconds (default: 30)
+            cache_ttl: Seconds to keep archetype lookups cached (default: 900)
+            cache_enabled: Cache archetype lookups in-process (default: True)
+            max_workers: Default number of threads for get_archetypes (default: 8)
+            max_retries: Retries for connection errors and 502/503/504 replies
+                to GET requests, with exponential backoff (default: 3, 0 disables)
         """
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.api_secret = api_secret
         self.timeout = timeout
+        self.max_workers = max_workers
+        self._ipad_ctx, self._opad_ctx = _hmac_sha256_pads(api_secret)
+        
+        # Bodyless GET signatures keyed by (path, timestamp second)
+        self._sig_cache: Dict[Tuple[str, int], str] = {}
+        self._sig_cache_second = 0
+        self._sig_cache_lock = threading.Lock()
+        
+        # Archetypes are reference data: cache GET responses by path. Entries
+        # outlive their TTL so stale ones can be revalidated with a
+        # conditional GET instead of being downloaded again.
+        self._cache_ttl = cache_ttl
+        self._cache: Optional[LRUCache] = LRUCache(maxsize=4096) if cache_enabled else None
+        self._cache_lock = threading.Lock()
+        
+        # Persistent session: pooled keep-alive connections avoid a new
+        # TCP/TLS handshake on every request. The pool is sized so that
+        # get_archetypes threads do not queue for a connection.
+        self._pool_maxsize = max(max_workers, 20)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=self._pool_maxsize,
+            max_retries=_build_retry(max_retries),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers.update({
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        })
+        self._session.hooks["response"].append(_parse_response_hook)
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections."""
+        self._session.close()
+    
+    def invalidate(self, archepid: str) -> None:
+        """
+        Drop a cached archetype so the next lookup hits the API.
+        
+        Args:
+            archepid: Archetype ID to evict
+        """
+        if self._cache is not None:
+            with self._cache_lock:
+                self._cache.pop(self._ARCHETYPE_PREFIX + archepid, None)
+    
+    def clear_cache(self) -> None:
+        """Drop all cached archetype and strategy lookups."""
+        if self._cache is not None:
+            with self._cache_lock:
+                self._cache.clear()
+    
+    def __enter__(self) -> "ArchetypeClient":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
     
     def _generate_signature(
         self,
-        method: str,
-        path: str,
-        timestamp: str,
-        body: Optional[str] = None,
+        method: bytes,
+        path: bytes,
+        timestamp: bytes,
+        body: Optional[bytes] = None,
     ) -> str:
         """
         Generate HMAC SHA256 signature for the request.
         
         Args:
-            method: HTTP method (GET, POST, etc.)
-            path: API endpoint path
-            timestamp: Unix timestamp as string
-            body: Request body as string (optional)
+            method: Uppercased HTTP method as bytes (b"GET", b"POST", etc.)
+            path: API endpoint path as UTF-8 bytes
+            timestamp: Unix timestamp as ASCII bytes
+            body: Request body as UTF-8 bytes (optional)
         
         Returns:
             Hexadecimal signature string
         """
         # Create the message to sign
         # Format: METHOD + PATH + TIMESTAMP + (BODY if exists)
-        message_parts = [method.upper(), path, timestamp]
         if body:
-            message_parts.append(body)
-        
-        message = "|".join(message_parts)
+            message = b"|".join((method, path, timestamp, body))
+        else:
+            message = b"|".join((method, path, timestamp))
         
-        # Generate HMAC SHA256 signature
-        signature = hmac.new(
-            self.api_secret.encode("utf-8"),
-            message.encode("utf-8"),
-            hashlib.sha256
-        ).hexdigest()
-        
-        return signature
+        # Generate HMAC SHA256 signature from the precomputed key pads
+        inner = self._ipad_ctx.copy()
+        inner.update(message)
+        outer = self._opad_ctx.copy()
+        outer.update(inner.digest())
+        return outer.hexdigest()
     
-    def _get_headers(self, method: str, path: str, body: Optional[str] = None) -> Dict[str, str]:
+    def _get_headers(self, method: str, path: str, body: Optional[bytes] = None) -> Dict[str, str]:
         """
         Generate authentication headers for the request.
         
         Args:
             method: HTTP method
             path: API endpoint path
-            body: Request body as string (optional)
+            body: Serialized request body as bytes (optional)
         
         Returns:
-            Dictionary of headers
+            Dictionary of authentication headers; Accept and Content-Type
+            come from the session defaults
         """
-        timestamp = str(int(time.time()))
-        signature = self._generate_signature(method, path, timestamp, body)
+        ts_int = time.time_ns() // 1_000_000_000
+        timestamp = str(ts_int)
+        
+        # A bodyless GET signs only (path, timestamp), so repeated calls to
+        # the same path within one second can reuse the signature
+        memoize = not body and method.upper() == "GET"
+        signature = None
+        if memoize:
+            with self._sig_cache_lock:
+                signature = self._sig_cache.get((path, ts_int))
+        if signature is None:
+            signature = self._generate_signature(
+                method.upper().encode("ascii"),
+                path.encode("utf-8"),
+                timestamp.encode("ascii"),
+                body,
+            )
+            if memoize:
+                with self._sig_cache_lock:
+                    # Keep the memo bounded: once a new second starts, drop
+                    # entries more than two seconds old
+                    if ts_int != self._sig_cache_second:
+                        self._sig_cache_second = ts_int
+                        for key in [k for k in self._sig_cache if k[1] < ts_int - 2]:
+                            del self._sig_cache[key]
+                    self._sig_cache[(path, ts_int)] = signature
         
         return {
             "X-API-Key": self.api_key,
             "X-Timestamp": timestamp,
             "X-Signature": signature,
-            "Content-Type": "application/json",
-            "Accept": "application/json",
         }
     
+    def _parse_json(self, response: requests.Response) -> Dict:
+        """
+        Decode a JSON response body, using orjson when it is installed.
+        
+        The body is parsed from its raw bytes rather than going through a
+        decoded ``response.text`` copy of the payload.
+        
+        Args:
+            response: HTTP response to decode
+        
+        Returns:
+            Decoded response data
+        
+        Raises:
+            ArchetypeAPIError: If the body is not valid JSON
+        """
+        # Session responses arrive already decoded by _parse_response_hook
+        parsed = getattr(response, "_parsed", _UNPARSED)
+        if parsed is not _UNPARSED:
+            return parsed
+        
+        try:
+            return _loads(response.content)
+        except ValueError as e:
+            raise ArchetypeAPIError(
+                message=f"Invalid JSON response: {str(e)}",
+                status_code=response.status_code,
+            )
+    
     def _make_request(
         self,
         method: str,
@@ -132,33 +415,61 @@ class ArchetypeClient:
             ArchetypeAPIError: If the API returns an error
             AuthenticationError: If authentication fails
         """
-        url = f"{self.base_url}{path}"
+        url = self.base_url + path
         
-        # Prepare body for signature if it exists
-        body_str = None
+        # Serialize the body once: the same bytes are signed and sent, in the
+        # compact sorted-key form documented in INTERNAL_API_SETUP.md
+        body_bytes = None
         if json_data:
-            import json
-            body_str = json.dumps(json_data, sort_keys=True)
+            body_bytes = json.dumps(json_data, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        
+        headers = self._get_headers(method, path, body_bytes)
         
-        headers = self._get_headers(method, path, body_str)
+        # Conditional GET: validators are added after signing, they are not
+        # part of the signed message
+        cacheable = self._cache is not None and method == "GET" and not params
+        cached = None
+        if cacheable:
+            with self._cache_lock:
+                cached = self._cache.get(path)
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
         
         try:
-            response = requests.request(
+            response = self._session.request(
                 method=method,
                 url=url,
                 headers=headers,
                 params=params,
-                json=json_data,
+                data=body_bytes,
                 timeout=self.timeout,
             )
             
+            # Not modified: the cached body is still current
+            if response.status_code == 304 and cached is not None:
+                with self._cache_lock:
+                    self._cache[path] = cached._replace(
+                        etag=response.headers.get("ETag", cached.etag),
+                        last_modified=response.headers.get("Last-Modified", cached.last_modified),
+                        expires_at=time.monotonic() + self._cache_ttl,
+                    )
+                return cached.body
+            
             # Handle authentication errors
             if response.status_code == 401:
                 raise AuthenticationError("Authentication failed: Invalid API key or signature")
             
             # Handle other errors
             if response.status_code >= 400:
-                error_data = response.json() if response.content else {}
+                error_data = {}
+                if response.content:
+                    try:
+                        error_data = self._parse_json(response)
+                    except ArchetypeAPIError:
+                        pass
                 error_msg = error_data.get("errmsg", f"API error: {response.status_code}")
                 raise ArchetypeAPIError(
                     message=error_msg,
@@ -166,7 +477,16 @@ class ArchetypeClient:
                     error_code=error_data.get("errorcode"),
                 )
             
-            return response.json()
+            result = self._parse_json(response)
+            if cacheable:
+                with self._cache_lock:
+                    self._cache[path] = _CacheEntry(
+                        body=result,
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified"),
+                        expires_at=time.monotonic() + self._cache_ttl,
+                    )
+            return result
         
         except requests.exceptions.RequestException as e:
             raise ArchetypeAPIError(
@@ -174,6 +494,31 @@ class ArchetypeClient:
                 status_code=0,
             )
     
+    def _cached_get(self, path: str) -> Dict:
+        """
+        Make a GET request, serving it from the in-process cache when possible.
+        
+        Fresh entries are returned without a request; stale ones are
+        revalidated by _make_request with a conditional GET. Callers get
+        their own copy of the cached data, so mutating a result does not
+        affect later lookups.
+        
+        Args:
+            path: API endpoint path
+        
+        Returns:
+            Response data as dictionary
+        """
+        if self._cache is None:
+            return self._make_request("GET", path)
+        
+        with self._cache_lock:
+            cached = self._cache.get(path)
+        if cached is not None and cached.expires_at > time.monotonic():
+            return copy.deepcopy(cached.body)
+        
+        return copy.deepcopy(self._make_request("GET", path))
+    
     def get_strategy_archetypes(self, sid: str) -> Dict[str, List[str]]:
         """
         Get all archetype IDs for a strategy.
@@ -189,8 +534,7 @@ class ArchetypeClient:
             >>> print(result["archepids"])
             ["A052071812-7a9581c6-...", "A052071813-8b0692d7-..."]
         """
-        path = f"/internal/archetype/strategy/{sid}"
-        return self._make_request("GET", path)
+        return self._cached_get(self._STRATEGY_PREFIX + sid)
     
     def get_archetype(self, archepid: str) -> Dict[str, Dict]:
         """
@@ -207,6 +551,45 @@ class ArchetypeClient:
             >>> print(result["archetypeportfolio"])
             {"HSX:TPB": 0.35, "HSX:SSI": 0.25, ...}
         """
-        path = f"/internal/archetype/{archepid}"
-        return self._make_request("GET", path)
-
+        return self._cached_get(self._ARCHETYPE_PREFIX + archepid)
+    
+    def get_archetypes(
+        self,
+        archepids: List[str],
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, Dict[str, Dict]]:
+        """
+        Get several archetypes concurrently.
+        
+        Requests run in a thread pool over the shared session. The only
+        state the threads share is the response cache and the signature
+        memo, and each of those is guarded by its own lock.
+        
+        Args:
+            archepids: Archetype IDs to fetch (duplicates are fetched once)
+            max_workers: Number of threads (default: the client's max_workers).
+                Capped at the session's connection pool size, max(max_workers, 20)
+                from the constructor, so every thread keeps a pooled connection.
+        
+        Returns:
+            Dictionary mapping each archetype ID to its get_archetype() result
+        
+        Raises:
+            ArchetypeAPIError: If any of the lookups fails
+        
+        Example:
+            >>> result = client.get_archetypes(["A052071812-...", "A052071813-..."])
+            >>> print(result["A052071812-..."]["archetypeportfolio"])
+            {"HSX:TPB": 0.35, "HSX:SSI": 0.25, ...}
+        """
+        unique_ids = list(dict.fromkeys(archepids))
+        if not unique_ids:
+            return {}
+        
+        # More threads than pooled connections would discard connections
+        # after each use and lose keep-alive
+        workers = min(max_workers or self.max_workers, self._pool_maxsize, len(unique_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(self.get_archetype, unique_ids))
+        
+        return dict(zip(unique_ids, results))
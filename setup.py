@@ -30,8 +30,16 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "requests>=2.28.0",
+        "urllib3>=1.26.0",
+        "cachetools>=5.0.0",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.6.0",
+        ],
+        "async": [
+            "httpx[http2]>=0.23.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
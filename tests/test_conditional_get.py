@@ -0,0 +1,123 @@
+"""
+Tests for conditional GET revalidation of cached archetypes.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from fortuna_archetype_client import ArchetypeClient
+
+ETAG = '"v1"'
+LAST_MODIFIED = "Wed, 14 Oct 2026 00:00:00 GMT"
+PORTFOLIO = {"archetypeportfolio": {"HSX:TPB": 0.35, "HSX:SSI": 0.25}}
+
+
+class _ArchetypeHandler(BaseHTTPRequestHandler):
+    """Serves one archetype with validators and honours If-None-Match."""
+    
+    protocol_version = "HTTP/1.1"
+    
+    def log_message(self, *args):
+        pass
+    
+    def do_GET(self):
+        self.server.requests.append(dict(self.headers))
+        
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.send_header("ETag", ETAG)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        
+        body = json.dumps(PORTFOLIO).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", ETAG)
+        self.send_header("Last-Modified", LAST_MODIFIED)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _ArchetypeHandler)
+    srv.requests = []
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture
+def client(server):
+    host, port = server.server_address
+    with ArchetypeClient(
+        base_url=f"http://{host}:{port}",
+        api_key="test-key",
+        api_secret="test-secret",
+        cache_ttl=60,
+        max_retries=0,
+    ) as client:
+        yield client
+
+
+def _expire(client, path):
+    """Mark a cached entry as stale without waiting for its TTL."""
+    client._cache[path] = client._cache[path]._replace(expires_at=0.0)
+
+
+def test_first_fetch_sends_no_validators(server, client):
+    assert client.get_archetype("A1") == PORTFOLIO
+    
+    assert len(server.requests) == 1
+    assert "If-None-Match" not in server.requests[0]
+    assert "If-Modified-Since" not in server.requests[0]
+
+
+def test_fresh_entry_is_served_without_a_request(server, client):
+    client.get_archetype("A1")
+    client.get_archetype("A1")
+    
+    assert len(server.requests) == 1
+
+
+def test_stale_entry_is_revalidated(server, client):
+    path = "/internal/archetype/A1"
+    client.get_archetype("A1")
+    _expire(client, path)
+    
+    client.get_archetype("A1")
+    
+    assert len(server.requests) == 2
+    assert server.requests[1]["If-None-Match"] == ETAG
+    assert server.requests[1]["If-Modified-Since"] == LAST_MODIFIED
+
+
+def test_not_modified_returns_cached_body_and_restarts_ttl(server, client):
+    path = "/internal/archetype/A1"
+    client.get_archetype("A1")
+    _expire(client, path)
+    
+    before = time.monotonic()
+    result = client.get_archetype("A1")
+    
+    assert result == PORTFOLIO
+    assert client._cache[path].expires_at >= before + 60
+    
+    # Fresh again after the 304: no further request
+    assert client.get_archetype("A1") == PORTFOLIO
+    assert len(server.requests) == 2
+
+
+def test_cached_results_are_copies(client):
+    first = client.get_archetype("A1")
+    first["archetypeportfolio"]["HSX:TPB"] = 1.0
+    
+    assert client.get_archetype("A1") == PORTFOLIO
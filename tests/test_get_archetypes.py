@@ -0,0 +1,96 @@
+"""
+Tests for concurrent bulk archetype lookups.
+"""
+
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from fortuna_archetype_client import ArchetypeClient
+
+
+class _Server(ThreadingHTTPServer):
+    # Accept a burst of concurrent connections from the thread pool
+    request_queue_size = 128
+
+
+class _ArchetypeHandler(BaseHTTPRequestHandler):
+    """Serves any archetype, echoing its path in the portfolio."""
+    
+    protocol_version = "HTTP/1.1"
+    
+    def log_message(self, *args):
+        pass
+    
+    def do_GET(self):
+        with self.server.lock:
+            self.server.paths.append(self.path)
+        
+        # Keep requests in flight long enough for the threads to overlap
+        time.sleep(0.02)
+        
+        body = json.dumps({"archetypeportfolio": {"path": self.path}}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    srv = _Server(("127.0.0.1", 0), _ArchetypeHandler)
+    srv.paths = []
+    srv.lock = threading.Lock()
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture
+def client(server):
+    host, port = server.server_address
+    with ArchetypeClient(
+        base_url=f"http://{host}:{port}",
+        api_key="test-key",
+        api_secret="test-secret",
+        max_retries=0,
+    ) as client:
+        yield client
+
+
+def _path(archepid):
+    return "/internal/archetype/" + archepid
+
+
+def test_duplicates_are_fetched_once_in_input_order(server, client):
+    ids = ["A3", "A1", "A3", "A2", "A1"]
+    
+    result = client.get_archetypes(ids)
+    
+    assert list(result) == ["A3", "A1", "A2"]
+    for archepid, archetype in result.items():
+        assert archetype["archetypeportfolio"]["path"] == _path(archepid)
+    assert sorted(server.paths) == sorted(_path(a) for a in ["A1", "A2", "A3"])
+
+
+def test_empty_input_makes_no_requests(server, client):
+    assert client.get_archetypes([]) == {}
+    assert server.paths == []
+
+
+def test_large_per_call_worker_count_keeps_pooled_connections(server, client, caplog):
+    ids = [f"A{i}" for i in range(100)]
+    
+    with caplog.at_level(logging.WARNING, logger="urllib3.connectionpool"):
+        result = client.get_archetypes(ids, max_workers=50)
+    
+    assert list(result) == ids
+    assert len(server.paths) == len(ids)
+    assert not [r for r in caplog.records if "Connection pool is full" in r.getMessage()]
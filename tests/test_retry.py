@@ -0,0 +1,38 @@
+"""
+Tests for the session retry policy.
+"""
+
+from urllib3.response import HTTPResponse
+
+from fortuna_archetype_client.client import _MAX_RETRY_AFTER, _build_retry
+
+
+def _response(status, headers=None):
+    return HTTPResponse(body=b"", headers=headers or {}, status=status, preload_content=False)
+
+
+def test_long_retry_after_is_capped():
+    retry = _build_retry(3)
+    
+    assert retry.get_retry_after(_response(503, {"Retry-After": "300"})) == _MAX_RETRY_AFTER
+
+
+def test_short_retry_after_is_kept():
+    retry = _build_retry(3)
+    
+    assert retry.get_retry_after(_response(503, {"Retry-After": "1"})) == 1
+
+
+def test_cap_survives_retry_increments():
+    retry = _build_retry(3).increment(method="GET", url="/", response=_response(503))
+    
+    assert retry.get_retry_after(_response(503, {"Retry-After": "300"})) == _MAX_RETRY_AFTER
+
+
+def test_only_gateway_errors_on_get_are_retried():
+    retry = _build_retry(3)
+    
+    assert retry.is_retry("GET", 503, has_retry_after=False)
+    assert not retry.is_retry("GET", 401, has_retry_after=False)
+    assert not retry.is_retry("GET", 500, has_retry_after=False)
+    assert not retry.is_retry("POST", 503, has_retry_after=False)
@@ -0,0 +1,61 @@
+"""
+Known-answer tests for request signing against the stdlib HMAC.
+"""
+
+import hashlib
+import hmac
+
+import pytest
+
+from fortuna_archetype_client import ArchetypeClient
+
+SECRETS = [
+    pytest.param("", id="empty"),
+    pytest.param("s", id="short"),
+    pytest.param("k" * 64, id="block-size"),
+    pytest.param("k" * 65, id="longer-than-block"),
+    pytest.param("k" * 200, id="much-longer-than-block"),
+    pytest.param("sécrét-ключ-秘密", id="non-ascii"),
+    pytest.param("é" * 40, id="non-ascii-longer-than-block"),
+]
+
+MESSAGES = [
+    pytest.param(b"GET", b"/internal/archetype/strategy/A052", b"1792000000", None, id="get"),
+    pytest.param(b"POST", b"/internal/archetype", b"1792000000", b'{"key":"value"}', id="post"),
+]
+
+
+def _expected(secret, method, path, timestamp, body):
+    parts = [method, path, timestamp] + ([body] if body else [])
+    return hmac.new(secret.encode("utf-8"), b"|".join(parts), hashlib.sha256).hexdigest()
+
+
+@pytest.mark.parametrize("secret", SECRETS)
+@pytest.mark.parametrize("method,path,timestamp,body", MESSAGES)
+def test_signature_matches_stdlib_hmac(secret, method, path, timestamp, body):
+    client = ArchetypeClient("http://localhost", api_key="k", api_secret=secret)
+    
+    signature = client._generate_signature(method, path, timestamp, body)
+    
+    assert signature == _expected(secret, method, path, timestamp, body)
+
+
+def test_repeated_signatures_do_not_share_state():
+    client = ArchetypeClient("http://localhost", api_key="k", api_secret="secret")
+    args = (b"GET", b"/internal/archetype/A1", b"1792000000")
+    
+    first = client._generate_signature(*args)
+    client._generate_signature(b"GET", b"/internal/archetype/A2", b"1792000000")
+    
+    assert client._generate_signature(*args) == first == _expected("secret", *args, None)
+
+
+def test_get_headers_signs_method_path_and_timestamp():
+    client = ArchetypeClient("http://localhost", api_key="key", api_secret="secret")
+    
+    headers = client._get_headers("get", "/internal/archetype/A1")
+    
+    assert headers["X-API-Key"] == "key"
+    assert headers["X-Signature"] == _expected(
+        "secret", b"GET", b"/internal/archetype/A1", headers["X-Timestamp"].encode("ascii"), None,
+    )